@@ -3,16 +3,66 @@ This module defines the main application window for the MARC Record Tool. It int
 different tabs for cataloging, searching libraries, and scraping MARC records.
 """
 
+import importlib
 import sys
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QTextEdit, QLabel,
                              QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QMessageBox)
 from cataloging_tab import CatalogingTab
-from search_tab import SearchTab
-from scrape_tab import ScrapeTab
+
+_HELP_HTML = (
+    "<b>Version 0.1</b><br>"
+    "<b>Original Cataloging Tab:</b><br>"
+    "Enter as much information as available.<br>"
+    "<b>Create MARC</b> will use the information created to create a MARC record, "
+    "but will not save it.<br>"
+    "<b>Download MARC</b> will download the created MARC record and prompt where "
+    "to save it.<br>"
+    "<b>Search Libraries</b> will send the ISBN, Title, and Author to the 'Search "
+    "Libraries' tab where those searches can be run, if so desired.<br><br>"
+    "<b>Search Libraries Tab:</b><br>"
+    "Enter the ISBN or the Title and Author to search other libraries that have "
+    "downloadable MARC records.<br>"
+    "<b>Cancel</b> will cancel the search.<br>"
+    "<b>Add Library</b> will allow you to add a new library. You must enter the "
+    "search URLs for an ISBN-only search and one for a Title and Author search, "
+    "using {isbn}, {title}, and {author} as placeholders.<br>"
+    "It is too complicated and unnecessary to parse an ISBN, title, and author "
+    "search URL if only the ISBN or only the title and author are provided.<br>"
+    "<b>Status</b> is clickable to take you to the URL that was searched.<br>"
+    "- <b>Found:</b> Indicates the book was found.<br>"
+    "- <b>Not found:</b> Means the book was not found.<br>"
+    "- <b>Timeout:</b> Means the search took too long and was cancelled.<br>"
+    "- <b>Error:</b> Means there was an error for that search.<br>"
+    "<b>Library Name:</b> The name of the library. This is arbitrary and doesn't "
+    "matter. The field can be clicked and edited.<br>"
+    "<b>ISBN URL:</b> The search URL for the ISBN with {isbn} where the ISBN number "
+    "would appear in the search URL. You can click and edit this field.<br>"
+    "<b>Title & Author URL:</b> The search URL for the Title and Author with {title} "
+    "and {author} where they would appear in the search URL. You can click and "
+    "edit this field.<br>"
+    "Right-click options:<br>"
+    "- <b>Search ISBN again:</b> Allows you to search that one URL again with the "
+    "information that has been entered.<br>"
+    "- <b>Search Title & Author again:</b> Allows you to search that one URL again "
+    "with the information that has been entered.<br>"
+    "- <b>Delete library:</b> Deletes the library from the search list.<br>"
+    "When the window is closed, it will prompt you if you want to save the edited "
+    "library list if the libraries have changed. This will create a .json file "
+    "that contains the list of libraries."
+)
 
 class ISBNQueryApp(QMainWindow):
     """Main application window for the MARC Record Tool."""
+
+    # Tab index -> (attribute name, module, class name, tab label) for tabs built on first
+    # use; their modules, and the requests, lxml and pymarc imports they bring in, are
+    # imported then too
+    LAZY_TABS = {
+        1: ("search_tab", "search_tab", "SearchTab", "Search Libraries"),
+        2: ("scrape_tab", "scrape_tab", "ScrapeTab", "Scrape MARC"),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MARC Record Tool")
@@ -20,14 +70,16 @@ class ISBNQueryApp(QMainWindow):
 
         self.tab_widget = QTabWidget()
 
+        # Only the first tab is built up front; the others are built on first use
         self.cataloging_tab = CatalogingTab(self)
-        self.search_tab = SearchTab(self)
-        self.scrape_tab = ScrapeTab(self)
+        self.search_tab = None
+        self.scrape_tab = None
 
         # Add tabs
         self.tab_widget.addTab(self.cataloging_tab, "Original Cataloging")
-        self.tab_widget.addTab(self.search_tab, "Search Libraries")
-        self.tab_widget.addTab(self.scrape_tab, "Scrape MARC")
+        for *_, label in self.LAZY_TABS.values():
+            self.tab_widget.addTab(QWidget(), label)
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
 
         self.console_output = QTextEdit(self)
         self.console_output.setReadOnly(True)
@@ -60,6 +112,36 @@ class ISBNQueryApp(QMainWindow):
         self.setCentralWidget(container)
 
         self.changes_made = False
+        # The Help box is built on the first click of Help and reused after that
+        self.help_box = None
+
+    def ensure_tab(self, index):
+        """
+        Builds the tab at the given index if it is still a placeholder and returns it.
+        """
+        if index not in self.LAZY_TABS:
+            return self.tab_widget.widget(index)
+
+        attr, module_name, class_name, label = self.LAZY_TABS[index]
+        tab = getattr(self, attr)
+        if tab is not None:
+            return tab
+
+        tab_class = getattr(importlib.import_module(module_name), class_name)
+        tab = tab_class(self)
+        setattr(self, attr, tab)
+
+        # Swap the placeholder for the real tab without re-entering this slot
+        current_index = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, label)
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        return tab
 
     def closeEvent(self, event):
         """
@@ -67,10 +149,11 @@ class ISBNQueryApp(QMainWindow):
         prompts the user to save changes, and performs resource cleanup.
         """
         # Stop and wait for SearchWorker thread to finish
-        if hasattr(self, 'search_worker') and self.search_worker.isRunning():
+        search_worker = self.search_tab.search_worker if self.search_tab else None
+        if search_worker and search_worker.isRunning():
             self.console_output.append("Stopping search worker...")
-            self.search_worker.stop()
-            self.search_worker.wait()
+            search_worker.stop()
+            search_worker.wait()
 
         # Save URLs or any other data if changes were made
         if self.changes_made:
@@ -82,69 +165,39 @@ class ISBNQueryApp(QMainWindow):
                 QMessageBox.Cancel
             )
             if reply == QMessageBox.Yes:
-                self.save_urls()
+                self.search_tab.save_urls()
             elif reply == QMessageBox.Cancel:
                 event.ignore()
                 return
-        event.accept()
 
-        # Clean up any other resources
+        # Clean up any other resources before letting the window close
         self.cleanup_resources()
-
-        # Log that the application is closing
-        self.console_output.append("Application is closing...")
-
-        # Call the superclass closeEvent to ensure the event loop terminates correctly
         event.accept()
 
     def cleanup_resources(self):
-        """Placeholder for resource cleanup, e.g., closing files, network connections."""
+        """Releases resources held by the tabs, e.g., open network connections."""
+        if self.search_tab:
+            self.search_tab.finish_saving()
+        if self.scrape_tab:
+            self.scrape_tab.shutdown()
 
     def show_help(self):
         """Displays help information in a message box."""
-        help_text = (
-            "<b>Version 0.1</b><br>"
-            "<b>Original Cataloging Tab:</b><br>"
-            "Enter as much information as available.<br>"
-            "<b>Create MARC</b> will use the information created to create a MARC record, "
-            "but will not save it.<br>"
-            "<b>Download MARC</b> will download the created MARC record and prompt where "
-            "to save it.<br>"
-            "<b>Search Libraries</b> will send the ISBN, Title, and Author to the 'Search "
-            "Libraries' tab where those searches can be run, if so desired.<br><br>"
-            "<b>Search Libraries Tab:</b><br>"
-            "Enter the ISBN or the Title and Author to search other libraries that have "
-            "downloadable MARC records.<br>"
-            "<b>Cancel</b> will cancel the search.<br>"
-            "<b>Add Library</b> will allow you to add a new library. You must enter the "
-            "search URLs for an ISBN-only search and one for a Title and Author search, "
-            "using {isbn}, {title}, and {author} as placeholders.<br>"
-            "It is too complicated and unnecessary to parse an ISBN, title, and author "
-            "search URL if only the ISBN or only the title and author are provided.<br>"
-            "<b>Status</b> is clickable to take you to the URL that was searched.<br>"
-            "- <b>Found:</b> Indicates the book was found.<br>"
-            "- <b>Not found:</b> Means the book was not found.<br>"
-            "- <b>Timeout:</b> Means the search took too long and was cancelled.<br>"
-            "- <b>Error:</b> Means there was an error for that search.<br>"
-            "<b>Library Name:</b> The name of the library. This is arbitrary and doesn't "
-            "matter. The field can be clicked and edited.<br>"
-            "<b>ISBN URL:</b> The search URL for the ISBN with {isbn} where the ISBN number "
-            "would appear in the search URL. You can click and edit this field.<br>"
-            "<b>Title & Author URL:</b> The search URL for the Title and Author with {title} "
-            "and {author} where they would appear in the search URL. You can click and "
-            "edit this field.<br>"
-            "Right-click options:<br>"
-            "- <b>Search ISBN again:</b> Allows you to search that one URL again with the "
-            "information that has been entered.<br>"
-            "- <b>Search Title & Author again:</b> Allows you to search that one URL again "
-            "with the information that has been entered.<br>"
-            "- <b>Delete library:</b> Deletes the library from the search list.<br>"
-            "When the window is closed, it will prompt you if you want to save the edited "
-            "library list if the libraries have changed. This will create a .json file "
-            "that contains the list of libraries."
-        )
+        self.create_help_box()
+        self.help_box.exec_()
 
-        QMessageBox.information(self, "Help", help_text)
+    def create_help_box(self):
+        """
+        Creates the Help message box if it doesn't exist yet. The help HTML is set
+        once here, so Qt lays out the rich text a single time for the app lifetime.
+        """
+        if self.help_box is not None:
+            return
+        self.help_box = QMessageBox(self)
+        self.help_box.setIcon(QMessageBox.Information)
+        self.help_box.setWindowTitle("Help")
+        self.help_box.setTextFormat(Qt.RichText)
+        self.help_box.setText(_HELP_HTML)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,157 +1,425 @@
 """
 This module provides the ScrapeTab class for scraping MARC data from URLs and creating MARC records.
 """
+import re
+from collections import defaultdict
+from io import BytesIO
 from urllib.parse import urlparse, parse_qs  # Standard library import
-from pymarc import Record, Field, Subfield
+from pymarc import MARCReader, Record, Field, Subfield
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QMessageBox, QFileDialog
 )
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from utils import clean_filename  # Import the clean_filename function
 
+# One line of format_three text: a 3 character tag, a separator, two indicators,
+# another separator and then the subfield data ("245 10 $a Title $b Subtitle")
+_LINE_RE = re.compile(
+    r'^(?P<tag>[^\r\n]{0,3})[^\r\n]?(?P<ind1>[^\r\n])?(?P<ind2>[^\r\n])?[^\r\n]?'
+    r'(?P<data>[^\r\n]*)',
+    re.MULTILINE
+)
+# Accept header for the Primo sourceRecord API: binary MARC when it can serve it,
+# otherwise the usual text listing
+_MARC_ACCEPT = "application/marc, text/plain;q=0.9, */*;q=0.8"
+# Blank and '#' indicators are both written as '\'
+_IND_TABLE = str.maketrans({'#': '\\', ' ': '\\'})
+# A '$' delimited subfield: the code character followed by its value
+_SUBFIELD_RE = re.compile(r'\$([^$])([^$]*)')
+# Markers in the raw HTML bytes that identify each supported page format, so the page
+# is only handed to BeautifulSoup once its format is known. They are checked in this
+# order and the first format found wins, as with the soup.find checks they stand in for:
+# a div with the class "field" among its classes, a table with the id "marc", a pre with
+# the style "direction: ltr", and a table with the class "citation table table-striped".
+# Tag and attribute names match in any case but attribute values only exactly, as
+# BeautifulSoup matches them.
+_FORMAT_MARKERS = tuple((name, re.compile(pattern)) for name, pattern in (
+    ('format_one', rb'<(?i:div)\b[^>]*\s(?i:class)\s*=\s*["\']?(?:[^"\'>]*\s)?field[\s"\'>]'),
+    ('format_two', rb'<(?i:table)\b[^>]*\s(?i:id)\s*=\s*["\']?marc[\s"\'>]'),
+    ('format_three', rb'<(?i:pre)\b[^>]*\s(?i:style)\s*=\s*["\']direction: ltr["\']'),
+    ('format_four', rb'<(?i:table)\b[^>]*\s(?i:class)\s*=\s*["\']citation table table-striped["\']'),
+))
+# Comments, scripts and styles, which BeautifulSoup never matches markup inside, so
+# they are removed before the markers are searched
+_HIDDEN_MARKUP_RE = re.compile(
+    rb'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL
+)
+# The only parts of each page format that the parsers read; BeautifulSoup skips
+# building the rest of the tree
+_FORMAT_STRAINERS = {
+    'format_one': SoupStrainer('div', class_='field'),
+    'format_two': SoupStrainer('a', id='switchview'),
+    'format_three': SoupStrainer('pre', style='direction: ltr'),
+    'format_four': SoupStrainer('table', class_='citation table table-striped'),
+}
+_TABLE_STRAINER = SoupStrainer('table')
+
+
+def format_subfields(subfields):
+    """Formats subfields for display as '$a value $b value'."""
+    return " ".join("$" + sf.code + " " + sf.value for sf in subfields)
+
+
+def first_subfield(record, tag, code):
+    """Returns the stripped first subfield code of the first tag field, or ''."""
+    fields = record.get_fields(tag)
+    values = fields[0].get_subfields(code) if fields else []
+    return values[0].strip() if values else ''
 
-class ScrapeTab(QWidget):
+
+class ScrapeTab(QWidget):  # pylint: disable=too-many-instance-attributes
     """
     A class that represents the tab for scraping MARC data and creating MARC records.
     """
     def __init__(self, parent):
         super().__init__(parent)
         self.main_window = parent
-        self.base_url = ""
         self.marc_record = None
         self.default_filename = ""
 
-        # Group related attributes to reduce the number of instance attributes
-        self.ui_elements = {
-            "url_input": QLineEdit(),
-            "output_window": QTextEdit(),
-            "scrape_button": QPushButton("Scrape URL"),
-            "create_marc_button": QPushButton("Create MARC Record"),
-            "download_marc_button": QPushButton("Download MARC Record"),
-            "clear_button": QPushButton("Clear")  # Add the Clear button here
-        }
+        # One session for every request so follow-up fetches to the same host
+        # reuse the open connection instead of reconnecting
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        self.session.headers["User-Agent"] = "MARC Record Tool"
+
+        self.scrape_worker = None
+
+        # Log lines are collected and written to the console together on a short timer
+        self.log_buffer = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(16)
+        self.log_timer.timeout.connect(self.flush_log)
+        # Primo/discovery API URLs already built for a scraped URL
+        self.api_urls = {}
+
+        self.url_input = QLineEdit()
+        self.output_window = QTextEdit()
+        self.scrape_button = QPushButton("Scrape URL")
+        self.create_marc_button = QPushButton("Create MARC Record")
+        self.download_marc_button = QPushButton("Download MARC Record")
+        self.clear_button = QPushButton("Clear")
 
         # Layouts and widgets
         layout = QVBoxLayout()
         self.setup_url_input(layout)
         self.setup_buttons(layout)
-        self.ui_elements["output_window"].setReadOnly(True)
-        layout.addWidget(self.ui_elements["output_window"])
+        self.output_window.setReadOnly(True)
+        layout.addWidget(self.output_window)
         self.setLayout(layout)
 
     def setup_url_input(self, layout):
         """Sets up the URL input field."""
         url_layout = QHBoxLayout()
         url_layout.addWidget(QLabel("MARC URL:"))
-        url_layout.addWidget(self.ui_elements["url_input"])
+        url_layout.addWidget(self.url_input)
         layout.addLayout(url_layout)
 
     def setup_buttons(self, layout):
         """Sets up the buttons for the scraping and MARC record creation."""
         buttons_layout = QHBoxLayout()
-        buttons_layout.addWidget(self.ui_elements["scrape_button"])
-        buttons_layout.addWidget(self.ui_elements["create_marc_button"])
-        buttons_layout.addWidget(self.ui_elements["download_marc_button"])
-        buttons_layout.addWidget(self.ui_elements["clear_button"])
-        self.ui_elements["scrape_button"].clicked.connect(self.scrape_url)
-        self.ui_elements["create_marc_button"].clicked.connect(self.create_marc_record)
-        self.ui_elements["download_marc_button"].clicked.connect(self.download_marc_record)
-        self.ui_elements["clear_button"].clicked.connect(self.clear_fields)
+        buttons_layout.addWidget(self.scrape_button)
+        buttons_layout.addWidget(self.create_marc_button)
+        buttons_layout.addWidget(self.download_marc_button)
+        buttons_layout.addWidget(self.clear_button)
+        self.scrape_button.clicked.connect(self.scrape_url)
+        self.create_marc_button.clicked.connect(self.create_marc_record)
+        self.download_marc_button.clicked.connect(self.download_marc_record)
+        self.clear_button.clicked.connect(self.clear_fields)
         layout.addLayout(buttons_layout)
 
     def log(self, message):
-        """Log a message to the main window's console output."""
-        self.main_window.console_output.append(message)
+        """Queue a message for the main window's console output."""
+        self.log_buffer.append(message)
+        self.log_timer.start()
+
+    def flush_log(self):
+        """Writes the queued log messages to the console output in one append."""
+        if self.log_buffer:
+            self.main_window.console_output.append("\n".join(self.log_buffer))
+            self.log_buffer.clear()
+
+    def shutdown(self):
+        """Waits for a running scrape and closes the HTTP session."""
+        if self.scrape_worker and self.scrape_worker.isRunning():
+            self.scrape_worker.wait()
+        self.session.close()
 
     def clear_fields(self):
         """Clears the URL input, output window, and MARC data."""
-        self.ui_elements["url_input"].clear()
-        self.ui_elements["output_window"].clear()
+        self.url_input.clear()
+        self.output_window.clear()
         self.marc_record = None
         self.default_filename = ""
         self.log("Cleared.")
 
     def scrape_url(self):
         """Scrapes the MARC data from the provided URL."""
-        url = self.ui_elements["url_input"].text().strip()
+        url = self.url_input.text().strip()
         if not url:
             QMessageBox.warning(self, "Input Error", "Please enter a valid URL.")
             return
 
         self.log(f"Scraping URL: {url}")
-        parsed_url = urlparse(url)
+        self.scrape_button.setEnabled(False)
+
+        # Fetching and parsing run on a ScrapeWorker thread so the GUI stays responsive
+        self.scrape_worker = ScrapeWorker(self.session, url, self.api_urls)
+        self.scrape_worker.message.connect(self.log)
+        self.scrape_worker.error.connect(self.show_error)
+        self.scrape_worker.parsed.connect(self.show_record)
+        self.scrape_worker.finished.connect(
+            lambda: self.scrape_button.setEnabled(True)
+        )
+        self.scrape_worker.start()
+
+    def show_error(self, title, message):
+        """Shows an error reported by the ScrapeWorker."""
+        QMessageBox.critical(self, title, message)
+
+    def show_record(self, marc_record, lines):
+        """Stores the record parsed by the ScrapeWorker and displays its fields."""
+        self.marc_record = marc_record
+        self.show_fields(lines)
+        self.update_filename()
+
+    def show_fields(self, lines):
+        """Appends the parsed field lines to the output window in a single update."""
+        if not lines:
+            return
+        self.output_window.setUpdatesEnabled(False)
+        self.output_window.append("\n".join(lines))
+        self.output_window.setUpdatesEnabled(True)
+
+    def create_marc_record(self):
+        """Creates a MARC record."""
+        if not self.marc_record:
+            QMessageBox.warning(
+                self, "No MARC Data", "No MARC data has been parsed to create a record."
+            )
+            return
+
+        # Index the fields once and share the index between validation and naming
+        fields_by_tag = self.index_fields()
+
+        # Perform validation
+        if not self.validate_marc_record(fields_by_tag):
+            QMessageBox.critical(
+                self, "Validation Error", "MARC record failed validation. Please correct the issues."
+            )
+            return
+
+        self.update_filename()
+        self.log("MARC record created and validated successfully.")
+        # Additional functionality for creating and processing MARC record can be added here
+
+    def index_fields(self):
+        """Returns the MARC record's fields grouped by tag in a single pass."""
+        fields_by_tag = defaultdict(list)
+        for field in self.marc_record.fields:
+            fields_by_tag[field.tag].append(field)
+        return fields_by_tag
+
+    def validate_marc_record(self, fields_by_tag):
+        """
+        Validates the MARC record for required fields and proper format.
+        fields_by_tag is the index returned by index_fields().
+        """
+        required_fields = ['001', '245']  # Example: 001 is control number, 245 is title
+        for tag in required_fields:
+            if not fields_by_tag[tag]:
+                self.log(f"Validation Error: Required field {tag} is missing.")
+                return False
+
+        # Additional validation logic here
+        # For example, ensure no duplicate 001 field
+        control_number_fields = fields_by_tag['001']
+        if len(control_number_fields) > 1:
+            self.log("Validation Error: Multiple 001 fields found.")
+            return False
+
+        # Ensure title field (245) has a subfield 'a' (main title)
+        title_fields = fields_by_tag['245']
+        if title_fields:
+            main_title_subfield = any(sf.code == 'a' for sf in title_fields[0].subfields)
+            if not main_title_subfield:
+                self.log("Validation Error: Field 245 is missing subfield 'a' for the main title.")
+                return False
+
+        return True
+
+    def update_filename(self):
+        """Update the filename based on the 100 and 245 fields and sanitize it."""
+        if not self.marc_record:
+            return
+
+        title = first_subfield(self.marc_record, '245', 'a') or "Untitled"
+        author = first_subfield(self.marc_record, '100', 'a') or "UnknownAuthor"
+
+        self.default_filename = clean_filename(f"{author}_{title}")
+        self.log(f"Filename set to {self.default_filename}")
+
+    def download_marc_record(self):
+        """Downloads the MARC record to a file."""
+        if not self.marc_record:
+            QMessageBox.warning(self, "No MARC Data", "No MARC record is available to download.")
+            return
+
+        default_filename = getattr(self, 'default_filename', 'marc_record.mrc')
+        save_path = QFileDialog.getSaveFileName(
+            None, "Save MARC Record", default_filename, "MARC Files (*.mrc)")[0]
+
+        if save_path:
+            try:
+                # Serialize first so a failure can't leave a truncated file behind
+                marc_bytes = self.marc_record.as_marc()
+                with open(save_path, 'wb', buffering=1 << 16) as file:
+                    file.write(marc_bytes)
+                self.log(f"MARC record saved successfully at {save_path}.")
+            except IOError as e:
+                self.log(f"File I/O error: {str(e)}")
+                QMessageBox.critical(
+                    None, "Error", f"An error occurred during MARC record saving: {str(e)}"
+                )
+        else:
+            self.log("Save operation was cancelled.")
+
+
+class ScrapeWorker(QThread):
+    """
+    A QThread that fetches a MARC URL and parses it into a pymarc Record off the GUI thread.
+    Log lines and errors are emitted as signals; the finished record and its display lines
+    are emitted through parsed.
+    """
+    message = pyqtSignal(str)
+    error = pyqtSignal(str, str)
+    parsed = pyqtSignal(object, list)
+
+    def __init__(self, session, url, api_urls):
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.api_urls = api_urls
+        self.base_url = ""
+        self.marc_record = None
+        self.output_lines = []
+
+    def run(self):
+        """Fetch and parse the URL, then emit the parsed record."""
+        parsed_url = urlparse(self.url)
         self.base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
+        if "primo.exlibrisgroup.com" in parsed_url.netloc:
+            self.log("Detected Primo Ex Libris URL.")
+            self.fetch_marc_data(parsed_url, source="primo")
+        elif "discovery/sourceRecord" in parsed_url.path:
+            self.log("Detected discovery/sourceRecord URL.")
+            self.fetch_marc_data(parsed_url, source="discovery")
+        else:
+            response = self.get(self.url, "Scraping Error", "Failed to scrape the URL")
+            if response is not None:
+                # lxml decodes the raw bytes itself, so skip requests' charset detection
+                self.parse_html(response.content)
+
+        if self.marc_record is not None:
+            self.parsed.emit(self.marc_record, self.output_lines)
+
+    def log(self, message):
+        """Send a message to the main window's console output."""
+        self.message.emit(message)
+
+    def get(self, url, error_title, error_text, headers=None):
+        """Returns the response for the URL, or None after reporting the failure."""
         try:
-            if "primo.exlibrisgroup.com" in parsed_url.netloc:
-                self.log("Detected Primo Ex Libris URL.")
-                self.fetch_marc_data(parsed_url, source="primo")
-            elif "discovery/sourceRecord" in parsed_url.path:
-                self.log("Detected discovery/sourceRecord URL.")
-                self.fetch_marc_data(parsed_url, source="discovery")
-            else:
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                self.parse_html(response.text)
+            response = self.session.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            self.log(f"Error scraping URL: {e}")
-            QMessageBox.critical(self, "Scraping Error", f"Failed to scrape the URL:\n{e}")
-
+            self.log(f"{error_text}: {e}")
+            self.error.emit(error_title, f"{error_text}:\n{e}")
+            return None
+        return response
 
     def fetch_marc_data(self, parsed_url, source="primo"):
         """Fetches MARC data from a specified source."""
-        query_params = parse_qs(parsed_url.query)
-        doc_id, vid, record_owner = query_params.get('docId'), query_params.get('vid'), query_params.get('recordOwner')
+        api_url = self.api_urls.get(self.url)
+        if api_url is None:
+            query_params = parse_qs(parsed_url.query)
+            doc_id = query_params.get('docId', [''])[0]
+            vid = query_params.get('vid', [''])[0]
+            record_owner = query_params.get('recordOwner', [''])[0]
+
+            if not all([doc_id, vid, record_owner]):
+                self.log(f"Failed to extract necessary parameters from {source} URL.")
+                self.error.emit("URL Error", "Unable to extract necessary parameters from the URL.")
+                return
+
+            api_url = f"https://{parsed_url.netloc}/primaws/rest/pub/sourceRecord?docId={doc_id}&vid={vid}&recordOwner={record_owner}&lang=en"
+            self.api_urls[self.url] = api_url
+
+        response = self.get(
+            api_url, "API Error", f"Failed to fetch MARC data from {source} API",
+            headers={"Accept": _MARC_ACCEPT}
+        )
+        if response is None:
+            return
 
-        if not all([doc_id, vid, record_owner]):
-            self.log(f"Failed to extract necessary parameters from {source} URL.")
-            QMessageBox.critical(self, "URL Error", "Unable to extract necessary parameters from the URL.")
+        # Read binary MARC directly and fall back to the text listing for anything else
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith("application/marc") and self.parse_binary_marc(response.content):
             return
+        self.parse_format_three(response.text)
+
+    def parse_binary_marc(self, marc_bytes):
+        """Reads an ISO 2709 MARC record. Returns False if it could not be read."""
+        reader = MARCReader(BytesIO(marc_bytes), to_unicode=True, force_utf8=True, permissive=True)
+        record = next(reader, None)
+        if record is None:
+            self.log("Could not read the binary MARC record; parsing it as text instead.")
+            return False
 
-        api_url = f"https://{parsed_url.netloc}/primaws/rest/pub/sourceRecord?docId={doc_id[0]}&vid={vid[0]}&recordOwner={record_owner[0]}&lang=en"
+        # Drop the control fields the same way parse_format_three does
+        record.fields = [field for field in record.fields if not field.is_control_field()]
+        output_lines = []
+        for field in record.fields:
+            indicators = (field.indicator1 + field.indicator2).replace(' ', '\\')
+            output_lines.append(f"={field.tag}  {indicators} {format_subfields(field.subfields)}")
 
-        try:
-            response = requests.get(api_url, timeout=10)
-            response.raise_for_status()
-            self.parse_format_three(response.text)
-        except requests.exceptions.RequestException as e:
-            self.log(f"Error fetching MARC data from {source} API: {e}")
-            QMessageBox.critical(self, "API Error", f"Failed to fetch MARC data from {source} API:\n{e}")
+        self.marc_record = record
+        self.output_lines = output_lines
+        self.log(f"Finished parsing. Parsed {len(record.get_fields())} fields.")
+        return True
 
     def parse_html(self, html):
-        """Parses the HTML content to detect the MARC format and extract data."""
-        soup = BeautifulSoup(html, 'html.parser')
+        """Parses the raw HTML bytes to detect the MARC format and extract data."""
         parse_methods = {
             'format_one': self.parse_format_one,
             'format_two': self.parse_format_two,
-            'format_three': self.parse_format_three,
+            'format_three': self.parse_format_three_html,
             'format_four': self.parse_format_four
         }
-        format_detected = None
-
-        if soup.find('div', class_='field'):
-            format_detected = 'format_one'
-        elif soup.find('table', id='marc'):
-            format_detected = 'format_two'
-        elif soup.find('pre', style='direction: ltr'):
-            format_detected = 'format_three'
-        elif soup.find('table', class_='citation table table-striped'):
-            format_detected = 'format_four'
+        markup = _HIDDEN_MARKUP_RE.sub(b'', html)
+        format_detected = next((name for name, marker in _FORMAT_MARKERS if marker.search(markup)), None)
 
         if format_detected:
             self.log(f"Detected {format_detected}.")
+            soup = BeautifulSoup(html, 'lxml', parse_only=_FORMAT_STRAINERS[format_detected])
             parse_methods[format_detected](soup)
         else:
             self.log("Unknown format detected.")
-            QMessageBox.critical(self, "Format Error", "Unable to identify the MARC format in the provided HTML.")
-
-
+            self.error.emit("Format Error", "Unable to identify the MARC format in the provided HTML.")
 
     def parse_format_one(self, soup):
         """Parses MARC data in format_one."""
         self.marc_record = Record()
+        output_lines = []
+        add_field = self.marc_record.add_field
+        add_line = output_lines.append
 
         fields = soup.find_all('div', class_='field')
         for field in fields:
@@ -160,37 +428,31 @@ class ScrapeTab(QWidget):
                 continue
 
             tag = tag_span.get_text().strip()
-            ind1 = field.find('div', class_='ind1').get_text().strip() \
-                if field.find('div', class_='ind1') else ' '
-            ind2 = field.find('div', class_='ind2').get_text().strip() \
-                if field.find('div', class_='ind2') else ' '
+            ind1_div = field.find('div', class_='ind1')
+            ind1 = ind1_div.get_text().strip() if ind1_div else ' '
+            ind2_div = field.find('div', class_='ind2')
+            ind2 = ind2_div.get_text().strip() if ind2_div else ' '
 
             # Control fields do not have indicators
             indicators = None if tag in ['001', '003', '005', '008'] else [ind1, ind2]
 
             subfield_objs = []
-            subfields = field.find_all('span', class_='sub_code')
-            for subfield in subfields:
+            for subfield in field.find_all('span', class_='sub_code'):
                 code = subfield.get_text().strip().replace('|', '')
-                value = subfield.next_sibling.strip() if subfield.next_sibling else ''
+                next_sibling = subfield.next_sibling
+                value = next_sibling.strip() if next_sibling else ''
                 subfield_objs.append(Subfield(code, value))
 
             if subfield_objs:
                 try:
-                    self.marc_record.add_field(Field(tag, indicators, subfields=subfield_objs))
-                    self.ui_elements["output_window"].append(
-                        f"{tag} {ind1}{ind2} "
-                        f"{' '.join(f'${sf.code} {sf.value}' for sf in subfield_objs)}"
+                    add_field(Field(tag, indicators, subfields=subfield_objs))
+                    add_line(
+                        f"{tag} {ind1}{ind2} {format_subfields(subfield_objs)}"
                     )
-                except ValueError as e:
-                    self.log(f"ValueError adding field {tag}: {str(e)}")
-                except TypeError as e:
-                    self.log(f"TypeError adding field {tag}: {str(e)}")
-                except KeyError as e:
-                    self.log(f"KeyError adding field {tag}: {str(e)}")
-                except Exception as e:
-                    self.log(f"Unexpected error adding field {tag}: {str(e)}")
-                    raise
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.log(f"Error adding field {tag}: {type(e).__name__}: {e}")
+
+        self.output_lines = output_lines
 
     def parse_format_two(self, soup):
         """Parses MARC data in format_two."""
@@ -201,72 +463,71 @@ class ScrapeTab(QWidget):
             self.log(f"Found 'view plain' link: {plain_url}")
 
             # Request the plain MARC data
-            try:
-                plain_response = requests.get(plain_url, timeout=10)
-                plain_response.raise_for_status()
-                self.parse_plain_marc(plain_response.text)
-            except requests.exceptions.RequestException as e:
-                self.log(f"Error fetching plain MARC data: {e}")
-                QMessageBox.critical(self, "Fetch Error", f"Failed to fetch plain MARC data:\n{e}")
+            response = self.get(plain_url, "Fetch Error", "Failed to fetch plain MARC data")
+            if response is not None:
+                self.parse_plain_marc(response.content)
         else:
             self.log("ERROR: 'View plain' link not found. Cannot continue with format_two parsing.")
-            QMessageBox.critical(self, "Parsing Error", "Unable to find the 'view plain' link.")
+            self.error.emit("Parsing Error", "Unable to find the 'view plain' link.")
 
     def parse_format_three(self, marc_data):
         """Parses MARC data in format_three."""
         self.marc_record = Record()
-        lines = marc_data.splitlines()
+        output_lines = []
+        # Bound once so the per-field calls below skip the attribute lookups
+        add_field = self.marc_record.add_field
+        add_line = output_lines.append
 
-        for line in lines:
+        for match in _LINE_RE.finditer(marc_data):
+            line = match.group(0)
             if not line.strip() or line.startswith('leader'):
                 continue  # Skip empty lines and the "leader" line
 
             # The first three characters represent the field tag
-            tag = line[:3].strip()
+            tag = match.group('tag').strip()
 
             # Discard fields with tags from 000 to 009
             if tag.isdigit() and 0 <= int(tag) <= 9:
                 self.log(f"Discarded field with tag {tag}: {line}")
                 continue
 
-            # Extract indicators
-            ind1 = line[4] if len(line) > 4 and line[4] != ' ' else '\\'
-            ind2 = line[5] if len(line) > 5 and line[5] != ' ' else '\\'
-
-            # Replace '#' with '\' in indicators
-            ind1 = '\\' if ind1 == '#' else ind1
-            ind2 = '\\' if ind2 == '#' else ind2
+            # Extract indicators, writing blank and '#' indicators as '\'
+            indicators = (match.group('ind1') or ' ') + (match.group('ind2') or ' ')
+            ind1, ind2 = indicators.translate(_IND_TABLE)
 
-            # Extract subfield data
-            subfield_data = line[7:].strip()  # Subfield data starts after the indicators and space
-            subfields = []
-
-            # Split subfields based on the '$' delimiter
-            if subfield_data:
-                parts = subfield_data.split('$')
-                for part in parts:
-                    if part:
-                        subfield_code = part[0]
-                        subfield_value = part[1:].strip()
-                        subfields.append(Subfield(subfield_code, subfield_value))
+            # Split the subfield data on the '$' delimiter
+            subfields = [
+                Subfield(code, value.strip())
+                for code, value in _SUBFIELD_RE.findall(match.group('data'))
+            ]
 
             # Add the field to the MARC record
             if subfields:
-                self.marc_record.add_field(
+                add_field(
                     Field(tag, indicators=[ind1, ind2], subfields=subfields)
                 )
                 # Display each field in the output window
-                field_output = (
-                    f"={tag}  {ind1}{ind2} {' '.join(f'${sf.code} {sf.value}' for sf in subfields)}"
-                )
-                self.ui_elements["output_window"].append(field_output)
+                field_output = f"={tag}  {ind1}{ind2} {format_subfields(subfields)}"
+                add_line(field_output)
 
+        self.output_lines = output_lines
         self.log(f"Finished parsing. Parsed {len(self.marc_record.get_fields())} fields.")
-        self.update_filename()
+
+    def parse_format_three_html(self, soup):
+        """Parses format_three MARC text embedded in an HTML <pre> block."""
+        marc_pre = soup.find('pre', style='direction: ltr')
+        if marc_pre is None:
+            self.log("ERROR: MARC text block not found.")
+            self.error.emit("Format Error", "Unable to find the MARC text in the provided HTML.")
+            return
+        self.parse_format_three(marc_pre.get_text())
 
     def parse_format_four(self, soup):
         """Parses MARC data in format_four."""
         self.marc_record = Record()
+        output_lines = []
+        add_field = self.marc_record.add_field
+        add_line = output_lines.append
 
         # Locate the MARC table in the HTML
         marc_table = soup.find('table', class_='citation table table-striped')
@@ -308,31 +569,25 @@ class ScrapeTab(QWidget):
 
             if subfields:
                 try:
-                    self.marc_record.add_field(
+                    add_field(
                         Field(tag, indicators=[ind1, ind2], subfields=subfields)
                     )
                     # Display each field in the output window
-                    field_output = (
-                        f"={tag}  {ind1}{ind2} "
-                        f"{' '.join(f'${sf.code} {sf.value}' for sf in subfields)}"
-                    )
+                    field_output = f"={tag}  {ind1}{ind2} {format_subfields(subfields)}"
 
-                    self.ui_elements["output_window"].append(field_output)
-                except ValueError as e:
-                    self.log(f"ValueError adding field {tag}: {str(e)}")
-                except TypeError as e:
-                    self.log(f"TypeError adding field {tag}: {str(e)}")
-                except KeyError as e:
-                    self.log(f"KeyError adding field {tag}: {str(e)}")
-                except Exception as e:
-                    self.log(f"Unexpected error adding field {tag}: {str(e)}")
-                    raise
+                    add_line(field_output)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.log(f"Error adding field {tag}: {type(e).__name__}: {e}")
 
+        self.output_lines = output_lines
         self.log(f"Finished parsing. Parsed {len(self.marc_record.get_fields())} fields.")
 
-    def parse_plain_marc(self, plain_text):
-        """Parses plain MARC data."""
+    def parse_plain_marc(self, plain_html):
+        """Parses plain MARC data from the raw page bytes."""
         self.marc_record = Record()
+        output_lines = []
+        add_field = self.marc_record.add_field
+        add_line = output_lines.append
 
         # Define the tags and subfields to be discarded
         discard_subfields = {
@@ -344,7 +599,7 @@ class ScrapeTab(QWidget):
         }
 
         # Parse the plain text with BeautifulSoup
-        plain_soup = BeautifulSoup(plain_text, 'html.parser')
+        plain_soup = BeautifulSoup(plain_html, 'lxml', parse_only=_TABLE_STRAINER)
 
         # Find the table containing the MARC data
         marc_table = plain_soup.find('table')
@@ -401,116 +656,18 @@ class ScrapeTab(QWidget):
                     # Add the parsed field to the MARC record
                     if current_tag and subfields:
                         try:
-                            self.marc_record.add_field(
+                            add_field(
                                 Field(current_tag, indicators, subfields=subfields)
                             )
                             # Display each field in the output window
                             field_output = (
-                                f"{current_tag} {ind1}{ind2} "
-                                f"{' '.join(f'${sf.code} {sf.value}' for sf in subfields)}"
+                                f"{current_tag} {ind1}{ind2} {format_subfields(subfields)}"
                             )
-                            self.ui_elements["output_window"].append(field_output)
-                        except ValueError as e:
-                            self.log(f"ValueError adding field {current_tag}: {str(e)}")
-                        except TypeError as e:
-                            self.log(f"TypeError adding field {current_tag}: {str(e)}")
-                        except KeyError as e:
-                            self.log(f"KeyError adding field {current_tag}: {str(e)}")
-                        except Exception as e:
-                            self.log(f"Unexpected error adding field {current_tag}: {str(e)}")
-                            raise
+                            add_line(field_output)
+                        except Exception as e:  # pylint: disable=broad-exception-caught
+                            self.log(f"Error adding field {current_tag}: {type(e).__name__}: {e}")
+
+        self.output_lines = output_lines
 
         # Log the number of parsed fields
         self.log(f"Finished parsing. Parsed {len(self.marc_record.get_fields())} fields.")
-
-        # Update the filename using the parsed fields and sanitize it
-        self.update_filename()
-
-    def create_marc_record(self):
-        """Creates a MARC record."""
-        if not self.marc_record:
-            QMessageBox.warning(
-                self, "No MARC Data", "No MARC data has been parsed to create a record."
-            )
-            return
-
-        # Perform validation
-        if not self.validate_marc_record():
-            QMessageBox.critical(
-                self, "Validation Error", "MARC record failed validation. Please correct the issues."
-            )
-            return
-
-        self.log("MARC record created and validated successfully.")
-        # Additional functionality for creating and processing MARC record can be added here
-
-    def validate_marc_record(self):
-        """Validates the MARC record for required fields and proper format."""
-        required_fields = ['001', '245']  # Example: 001 is control number, 245 is title
-        for tag in required_fields:
-            if not self.marc_record.get_fields(tag):
-                self.log(f"Validation Error: Required field {tag} is missing.")
-                return False
-
-        # Additional validation logic here
-        # For example, ensure no duplicate 001 field
-        control_number_fields = self.marc_record.get_fields('001')
-        if len(control_number_fields) > 1:
-            self.log("Validation Error: Multiple 001 fields found.")
-            return False
-
-        # Ensure title field (245) has a subfield 'a' (main title)
-        title_fields = self.marc_record.get_fields('245')
-        if title_fields:
-            main_title_subfield = any(sf.code == 'a' for sf in title_fields[0].subfields)
-            if not main_title_subfield:
-                self.log("Validation Error: Field 245 is missing subfield 'a' for the main title.")
-                return False
-
-        return True
-
-    def update_filename(self):
-        """Update the filename based on the 100 and 245 fields and sanitize it."""
-        if not self.marc_record:
-            return
-
-        title = ''
-        author = ''
-        for field in self.marc_record.get_fields('245', '100'):
-            subfields = field.subfields
-            for subfield in subfields:
-                if field.tag == '245' and subfield.code == 'a':
-                    title = subfield.value.strip()
-                elif field.tag == '100' and subfield.code == 'a':
-                    author = subfield.value.strip()
-
-        if not author:
-            author = "UnknownAuthor"
-        if not title:
-            title = "Untitled"
-
-        self.default_filename = clean_filename(f"{author}_{title}")
-        self.log(f"Filename set to {self.default_filename}")
-
-    def download_marc_record(self):
-        """Downloads the MARC record to a file."""
-        if not self.marc_record:
-            QMessageBox.warning(self, "No MARC Data", "No MARC record is available to download.")
-            return
-
-        default_filename = getattr(self, 'default_filename', 'marc_record.mrc')
-        save_path = QFileDialog.getSaveFileName(
-            None, "Save MARC Record", default_filename, "MARC Files (*.mrc)")[0]
-
-        if save_path:
-            try:
-                with open(save_path, 'wb') as file:
-                    file.write(self.marc_record.as_marc())
-                self.log(f"MARC record saved successfully at {save_path}.")
-            except IOError as e:
-                self.log(f"File I/O error: {str(e)}")
-                QMessageBox.critical(
-                    None, "Error", f"An error occurred during MARC record saving: {str(e)}"
-                )
-        else:
-            self.log("Save operation was cancelled.")
@@ -2,26 +2,204 @@
 This module defines the SearchTab class and the SearchWorker QThread for searching library catalogs.
 It provides an interface for searching by ISBN or Title & Author and displays the results in a table.
 """
+import codecs
+import functools
 import json
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as wait_futures
 import urllib.parse
 import webbrowser
 import requests
-import validators
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox,
     QInputDialog, QMessageBox, QMenu
 )
 from PyQt5.QtGui import QColor
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+# Library table cells can be selected but not edited in place
+_READ_ONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+# Most library result pages kept in the shared response cache
+_RESPONSE_CACHE_SIZE = 256
+# Seconds a cached result page is reused before it is fetched again
+_RESPONSE_CACHE_TTL = 5 * 60
+# Only the start of a result page is read; result banners and counts sit near the top
+_MAX_PAGE_BYTES = 256 * 1024
+# The general result wording is only looked for in the first part of the page
+_GENERAL_RESULTS_SCAN_BYTES = 64 * 1024
+
+# Page text that means a catalog found nothing, matched in any case against the page's
+# visible text. Words may be separated by any run of whitespace, since removing tags
+# leaves spaces where they were, e.g. "No results <b>found</b>".
+_NOT_FOUND_RE = re.compile(b"|".join(rb"\s+".join(map(re.escape, phrase.split())) for phrase in (
+    b"no results found", b"no matches found", b"no entries found", b"search resulted in no hits",
+    b"no results!", b"your search found no results.", b"no records found"
+)), re.IGNORECASE)
+# Markup that is not part of the page's visible text: comments, script and style blocks,
+# and tags with their attribute values
+_NON_TEXT_RE = re.compile(rb'<!--.*?-->|<(script|style)\b.*?</\1\s*>|<[^>]*>', re.IGNORECASE | re.DOTALL)
+_RESULTS_COUNT_RE = re.compile(rb'Results:\s*\d+', re.IGNORECASE)
+# General result count wording checked by _check_general_results, as one alternation so
+# the page is scanned once. "100 results found" is covered by the first branch.
+_RESULT_ANY_RE = re.compile(
+    rb'\b(?:your\s+search\s+returned\s+|\d+\s+)results?\b'  # "Your search returned 100 results"
+    rb'|\bResults:\s*\d+'  # "Results: 100"
+    rb'|\b\d+-\d+\s+of\s+\d+\b',  # "1-25 of 10000"
+    re.IGNORECASE
+)
+
+def _has_class(name):
+    """
+    Return an XPath predicate matching elements whose class attribute contains the class name.
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# The page tree checks are compiled once into XPath expressions that libxml2 evaluates in C;
+# re: is the EXSLT regular expression extension
+_XPATH_NAMESPACES = {"re": "http://exslt.org/regular-expressions"}
+# An h1 saying "no results", or the elements catalogs use for an empty result list
+_NOT_FOUND_XPATH = etree.XPath(
+    "boolean("
+    "//h1[re:test(., 'no results', 'i')]"
+    " | //div[@id='documents'][" + _has_class("noresults") + "]"
+    " | //tr[" + _has_class("yourEntryWouldBeHere") + "]"
+    ")",
+    namespaces=_XPATH_NAMESPACES
+)
+# Result count text in a span, e.g. "25 results found"
+_SPAN_RESULT_PATTERN = r'\d+\s+(?:results?|result|of\s+results?)\s*found'
+# Result rows, result count bars and text, bibliographic record sections, and positive
+# result totals in a meta tag or search-stats div. It is a single predicate over every
+# element so the tree is walked once. re:test calls back into Python, so a span's text is
+# first narrowed in C to text containing "found".
+_FOUND_XPATH = etree.XPath(
+    "boolean(//*["
+    "(self::tr and " + _has_class("browseEntry") + ")"
+    " or @id='numresults'"
+    " or (self::meta and @name='totalResults' and number(@content) > 0)"
+    " or (self::div and (contains(@class, 'document')"
+    " or " + _has_class("bibDisplayContentMain") + " or " + _has_class("bibDisplayItemsMain")
+    + " or " + _has_class("bibliographicData") + " or " + _has_class("browseSearchtoolMessage")
+    + " or (" + _has_class("search-stats") + " and number(@data-record-total) > 0)))"
+    " or (self::span and ((" + _has_class("results-bar-item")
+    + " and " + _has_class("results-bar-item-record-count") + ")"
+    " or (contains(translate(., 'FOUND', 'found'), 'found')"
+    " and re:test(., '" + _SPAN_RESULT_PATTERN + "', 'i'))))"
+    "])",
+    namespaces=_XPATH_NAMESPACES
+)
+
+def _check_not_found_conditions(tree):
+    """
+    Check the parsed page for various "not found" conditions.
+    The "no results" phrases are checked on the page text before parsing.
+    """
+    return _NOT_FOUND_XPATH(tree)
+
+def _check_found_conditions(tree, body, visible_text):
+    """
+    Check for various "found" conditions in the page.
+    Prioritize exact text searches over generic elements.
+    """
+    # Cheapest checks first; each runs only if the ones before it did not match.
+    # The text scans are single regex passes, so they go before the walk over the tree.
+    found_conditions = (
+        lambda: _RESULTS_COUNT_RE.search(visible_text),  # "Results: X found"
+        lambda: _check_general_results(body),  # Result count wording anywhere in the page
+        lambda: _FOUND_XPATH(tree)  # Result rows, count bars, record sections and totals
+    )
+    return any(condition() for condition in found_conditions)
+
+def _check_general_results(body):
+    """
+    Check the start of the page bytes for general result count wording.
+    """
+    # endpos bounds the scan without copying a slice of the page
+    return _RESULT_ANY_RE.search(body, 0, _GENERAL_RESULTS_SCAN_BYTES) is not None
+
+def _header_encoding(response):
+    """
+    Return the charset the response's Content-Type header declares, or None when it declares
+    none or one Python does not know. requests falls back to ISO-8859-1 for text/html without
+    a charset, which would override the page's own <meta charset>, so that is not used.
+    """
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        return None
+    try:
+        codecs.lookup(response.encoding)
+    except (LookupError, TypeError):
+        return None
+    return response.encoding
+
+def _page_parser(encoding):
+    """
+    Return an lxml HTML parser for a result page, decoding with the given charset when lxml
+    knows it and otherwise leaving libxml2 to detect it from the page.
+    Comments and processing instructions never affect the checks, and no check uses id(),
+    so the parser skips building those nodes and the ID table.
+    """
+    options = {"remove_comments": True, "remove_pis": True, "collect_ids": False}
+    if encoding:
+        try:
+            return lxml_html.HTMLParser(encoding=encoding, **options)
+        except LookupError:
+            # lxml does not know every name Python does, e.g. "latin_1"
+            pass
+    return lxml_html.HTMLParser(**options)
+
+def _valid_http_url(url):
+    """
+    Return True if the URL has an http or https scheme and a host.
+    """
+    parts = urllib.parse.urlsplit(url)
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
+
+def _url_quoter(url_template, placeholder):
+    """
+    Return the quoting function for a placeholder: form encoding inside the query string,
+    path encoding anywhere else.
+    """
+    query_start = url_template.find("?")
+    if query_start != -1 and query_start < url_template.find(placeholder):
+        return urllib.parse.quote_plus
+    return urllib.parse.quote
+
+@functools.lru_cache(maxsize=2048)
+def _format_isbn_url(url_template, isbn):
+    """
+    Return the ISBN search URL for a library's URL template.
+    """
+    return url_template.replace("{isbn}", _url_quoter(url_template, "{isbn}")(isbn))
+
+@functools.lru_cache(maxsize=2048)
+def _format_title_author_url(url_template, title, author):
+    """
+    Return the title and author search URL for a library's URL template.
+    """
+    title_quote = _url_quoter(url_template, "{title}")
+    author_quote = _url_quoter(url_template, "{author}")
+    return url_template.replace("{title}", title_quote(title)).replace("{author}", author_quote(author))
 
 class SearchTab(QWidget):
     """
     A QWidget class that provides an interface for searching library catalogs by ISBN, title, and author.
     The results are displayed in a table, and users can add or edit library entries and initiate searches.
     """
+    # Status cell backgrounds, shared by every update instead of built per cell
+    _COLOR_FOUND = QColor(144, 238, 144)
+    _COLOR_NOT_FOUND = QColor(255, 182, 193)
+    _COLOR_ERROR = QColor(255, 165, 0)
+    _COLOR_CANCELED = QColor(255, 165, 0)
+    _COLOR_WHITE = QColor(255, 255, 255)
+
     def __init__(self, parent=None):
         """
         Initialize the SearchTab instance with the parent widget.
@@ -29,8 +207,31 @@ class SearchTab(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.libraries = []
+        # Per-column copies of self.libraries, rebuilt whenever the list changes; workers get
+        # the URL template list for their search type and rows index straight into them
+        self.library_names = []
+        self.library_urls = {"isbn": [], "title_author": []}
         self.search_worker = None
         self.search_button = None
+        # Library result pages by URL with the time they were fetched, shared by every
+        # SearchWorker this tab starts; emptied by the Clear button
+        self.response_cache = OrderedDict()
+        # Held by every worker's threads while they read or update response_cache
+        self.cache_lock = threading.Lock()
+
+        # Status updates from the worker are applied to the table together on a short timer
+        self.pending_statuses = []
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(16)
+        self.status_timer.timeout.connect(self.flush_statuses)
+
+        # Library list edits are written to disk together, shortly after the last one
+        self.save_worker = None
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(500)
+        self.save_timer.timeout.connect(self.flush_libraries)
 
         # Initialize attributes that will be set up in init_ui
         self.isbn_input_search = None
@@ -135,7 +336,7 @@ class SearchTab(QWidget):
         self.cancel_button.clicked.connect(self.cancel_search)
         controls_layout.addWidget(self.cancel_button)
         self.clear_button = QPushButton("Clear")
-        self.clear_button.clicked.connect(self.clear_statuses)
+        self.clear_button.clicked.connect(self.clear_results)
         controls_layout.addWidget(self.clear_button)
         self.add_library_button = QPushButton("Add Library")
         self.add_library_button.clicked.connect(self.add_library)
@@ -175,29 +376,77 @@ class SearchTab(QWidget):
         except (FileNotFoundError, json.JSONDecodeError):
             self.libraries = []
             self.parent.console_output.append("No library list file found. Please add a library.")
+        self.rebuild_library_columns()
+
+    def rebuild_library_columns(self):
+        """
+        Rebuild the library name and URL template lists from self.libraries.
+        """
+        self.library_names = [library["name"] for library in self.libraries]
+        self.library_urls = {
+            "isbn": [library.get("isbn_url", "") for library in self.libraries],
+            "title_author": [library.get("title_author_url", "") for library in self.libraries]
+        }
 
     def populate_library_table(self):
         """
         Populate the table widget with the loaded library data.
         """
-        self.library_table.setRowCount(len(self.libraries))
-        for i, library in enumerate(self.libraries):
-            self.library_table.setItem(i, 0, QTableWidgetItem(""))
-            self.library_table.setItem(i, 1, QTableWidgetItem(library["name"]))
-            self.library_table.setItem(i, 2, QTableWidgetItem(library.get("isbn_url", "")))
-            self.library_table.setItem(i, 3, QTableWidgetItem(library.get("title_author_url", "")))
-
-            for col in range(4):
-                item = self.library_table.item(i, col)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+        table = self.library_table
+        # Fill the table in one pass without a repaint or signal per cell
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(self.libraries))
+            for i, library in enumerate(self.libraries):
+                values = ("", library["name"], library.get("isbn_url", ""), library.get("title_author_url", ""))
+                for col, value in enumerate(values):
+                    item = QTableWidgetItem(value)
+                    item.setFlags(_READ_ONLY_FLAGS)
+                    table.setItem(i, col, item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def save_urls(self):
         """
         Save the current list of libraries and their URLs to a JSON file.
         """
+        self.save_timer.stop()
+        if self.save_worker and self.save_worker.isRunning():
+            self.save_worker.wait()
         with open("libraries.json", "w", encoding="utf-8") as file:
             json.dump(self.libraries, file, indent=4)
 
+    def schedule_save(self):
+        """
+        Queue a save of the library list; edits made in quick succession are written once.
+        """
+        self.save_timer.start()
+
+    def flush_libraries(self):
+        """
+        Write the library list to disk on a LibrarySaveWorker thread.
+        """
+        if self.save_worker and self.save_worker.isRunning():
+            # Try again once the previous write has finished
+            self.save_timer.start()
+            return
+
+        # Serialize here so the worker never reads the list while it is being edited
+        self.save_worker = LibrarySaveWorker(json.dumps(self.libraries, indent=4))
+        self.save_worker.failed.connect(self.parent.console_output.append)
+        self.save_worker.start()
+
+    def finish_saving(self):
+        """
+        Write any queued library list changes and wait for a running save to finish.
+        """
+        if self.save_timer.isActive():
+            self.save_urls()
+        elif self.save_worker and self.save_worker.isRunning():
+            self.save_worker.wait()
+
     def start_isbn_search(self):
         """
         Start the ISBN search process by triggering the SearchWorker thread.
@@ -215,7 +464,8 @@ class SearchTab(QWidget):
         self.clear_statuses()
         self.disable_all_buttons_except_cancel()
 
-        self.search_worker = SearchWorker(self.libraries, None, "isbn", isbn, self.parent.console_output)
+        self.search_worker = SearchWorker(self.library_urls["isbn"], None, "isbn", isbn, self.parent.console_output,
+                                          self.response_cache, self.cache_lock)
         self.search_worker.update_status.connect(self.update_status)
         self.search_worker.search_complete.connect(self.reset_buttons)
         self.search_worker.start()
@@ -238,7 +488,8 @@ class SearchTab(QWidget):
         self.clear_statuses()
         self.disable_all_buttons_except_cancel()
 
-        self.search_worker = SearchWorker(self.libraries, None, "title_author", (title, author), self.parent.console_output)
+        self.search_worker = SearchWorker(self.library_urls["title_author"], None, "title_author", (title, author),
+                                          self.parent.console_output, self.response_cache, self.cache_lock)
         self.search_worker.update_status.connect(self.update_status)
         self.search_worker.search_complete.connect(self.reset_buttons)
         self.search_worker.start()
@@ -281,8 +532,9 @@ class SearchTab(QWidget):
             self.parent.console_output.append("Title or Author field is empty. Cannot perform the search.")
             return
 
-        self.search_worker = SearchWorker(self.libraries, index=row, search_type=search_type,
-                                          search_value=search_value, console_output=self.parent.console_output)
+        self.search_worker = SearchWorker(self.library_urls[search_type], index=row, search_type=search_type,
+                                          search_value=search_value, console_output=self.parent.console_output,
+                                          response_cache=self.response_cache, cache_lock=self.cache_lock)
         self.search_worker.update_status.connect(self.update_status)
         self.search_worker.search_complete.connect(self.reset_buttons)
         self.search_worker.start()
@@ -292,7 +544,7 @@ class SearchTab(QWidget):
             self.clear_statuses()
         else:
             self.library_table.item(row, 0).setText("")
-            self.library_table.item(row, 0).setBackground(QColor(255, 255, 255))
+            self.library_table.item(row, 0).setBackground(self._COLOR_WHITE)
 
         if search_type == "isbn" and search_value.strip():
             self.search_button = self.search_isbn_button
@@ -313,36 +565,61 @@ class SearchTab(QWidget):
             self.search_worker.stop()
             self.search_worker.wait()
 
+        # Apply the statuses that arrived before the worker stopped
+        self.flush_statuses()
         for row in range(self.library_table.rowCount()):
             status_item = self.library_table.item(row, 0)
             if status_item.text() == "Searching...":
                 status_item.setText("Canceled")
-                status_item.setBackground(QColor(255, 165, 0))
-                self.parent.console_output.append(f"{self.libraries[row]['name']}: Search canceled.")
+                status_item.setBackground(self._COLOR_CANCELED)
+                self.parent.console_output.append(f"{self.library_names[row]}: Search canceled.")
 
         self.reset_buttons()
 
     def update_status(self, row, status, url):
         """
-        Update the status of the search result in the table for the given row.
+        Queue a status update for the given row; queued updates are applied by flush_statuses.
         """
-        status_item = self.library_table.item(row, 0)
-        status_item.setText(status)
+        self.pending_statuses.append((row, status, url))
+        if not self.status_timer.isActive():
+            self.status_timer.start()
 
-        if status == "Found":
-            status_item.setBackground(QColor(144, 238, 144))
-            self.parent.console_output.append(f"{self.libraries[row]['name']}: Found - {url}")
-        elif status == "Not Found":
-            status_item.setBackground(QColor(255, 182, 193))
-            self.parent.console_output.append(f"{self.libraries[row]['name']}: Not Found")
-        elif status == "Error":
-            status_item.setBackground(QColor(255, 165, 0))
-            self.parent.console_output.append(f"{self.libraries[row]['name']}: Error accessing {url}")
-        else:
-            self.parent.console_output.append(f"{self.libraries[row]['name']}: {status}")
+    def flush_statuses(self):
+        """
+        Apply the queued status updates to the table with one repaint, one console append
+        and one scroll to the last updated row.
+        """
+        self.status_timer.stop()
+        if not self.pending_statuses:
+            return
 
-        status_item.setData(Qt.UserRole, url)
-        status_item.setToolTip("Double-click to open link")
+        updates, self.pending_statuses = self.pending_statuses, []
+        messages = []
+        status_item = None
+        self.library_table.setUpdatesEnabled(False)
+        try:
+            for row, status, url in updates:
+                status_item = self.library_table.item(row, 0)
+                status_item.setText(status)
+
+                if status == "Found":
+                    status_item.setBackground(self._COLOR_FOUND)
+                    messages.append(f"{self.library_names[row]}: Found - {url}")
+                elif status == "Not Found":
+                    status_item.setBackground(self._COLOR_NOT_FOUND)
+                    messages.append(f"{self.library_names[row]}: Not Found")
+                elif status == "Error":
+                    status_item.setBackground(self._COLOR_ERROR)
+                    messages.append(f"{self.library_names[row]}: Error accessing {url}")
+                else:
+                    messages.append(f"{self.library_names[row]}: {status}")
+
+                status_item.setData(Qt.UserRole, url)
+                status_item.setToolTip("Double-click to open link")
+        finally:
+            self.library_table.setUpdatesEnabled(True)
+
+        self.parent.console_output.append("\n".join(messages))
         self.library_table.scrollToItem(status_item)
 
     def disable_all_buttons_except_cancel(self):
@@ -366,13 +643,24 @@ class SearchTab(QWidget):
         self.clear_button.setEnabled(True)
         self.add_library_button.setEnabled(True)
 
+    def clear_results(self):
+        """
+        Clear the statuses and drop the cached result pages, so the next search fetches
+        every page again.
+        """
+        with self.cache_lock:
+            self.response_cache.clear()
+        self.clear_statuses()
+
     def clear_statuses(self):
         """
         Clear all statuses and reset the background color of the status column in the table.
         """
+        self.pending_statuses.clear()
+        self.status_timer.stop()
         for row in range(self.library_table.rowCount()):
             self.library_table.item(row, 0).setText("")
-            self.library_table.item(row, 0).setBackground(QColor(255, 255, 255))
+            self.library_table.item(row, 0).setBackground(self._COLOR_WHITE)
         self.parent.console_output.clear()
         self.parent.console_output.append("Cleared.")
 
@@ -426,7 +714,8 @@ class SearchTab(QWidget):
             "title_author_url": title_author_url.strip()
         })
         self.populate_library_table()
-        self.save_urls()
+        self.rebuild_library_columns()
+        self.schedule_save()
         self.parent.changes_made = True
 
     def library_context_menu(self, position):
@@ -485,7 +774,7 @@ class SearchTab(QWidget):
             QMessageBox.warning(self, "Invalid URL", "The ISBN URL must include {isbn} as a placeholder.")
             return
 
-        if not validators.url(isbn_url):
+        if not _valid_http_url(isbn_url):
             QMessageBox.warning(self, "Invalid URL", "The ISBN URL is not a valid URL.")
             return
 
@@ -506,7 +795,7 @@ class SearchTab(QWidget):
             QMessageBox.warning(self, "Invalid URL", "The Title & Author URL must include both {title} and {author}.")
             return
 
-        if not validators.url(title_author_url):
+        if not _valid_http_url(title_author_url):
             QMessageBox.warning(self, "Invalid URL", "The Title & Author URL is not a valid URL.")
             return
 
@@ -521,9 +810,10 @@ class SearchTab(QWidget):
             self.libraries[row]["name"] = library_name
             self.libraries[row]["isbn_url"] = isbn_url
             self.libraries[row]["title_author_url"] = title_author_url
+            self.rebuild_library_columns()
 
             self.parent.console_output.append(f"Library '{library_name}' updated: " + "; ".join(changes))
-            self.save_urls()
+            self.schedule_save()
         else:
             self.parent.console_output.append(f"No changes made to '{library_name}'.")
 
@@ -543,8 +833,9 @@ class SearchTab(QWidget):
             if reply == QMessageBox.Yes:
                 self.library_table.removeRow(row)
                 del self.libraries[row]
+                self.rebuild_library_columns()
                 self.parent.changes_made = True
-                self.save_urls()
+                self.schedule_save()
 
     def handle_double_click(self, row, column):
         """
@@ -564,183 +855,239 @@ class SearchWorker(QThread):
     """
     update_status = pyqtSignal(int, str, str)
     search_complete = pyqtSignal()
+    log_message = pyqtSignal(str)
 
-    def __init__(self, libraries, index=None, search_type=None, search_value=None, console_output=None):
+    def __init__(self, url_templates, index=None, search_type=None, search_value=None, console_output=None,
+                 response_cache=None, cache_lock=None):  # pylint: disable=too-many-arguments
         """
         Initialize the SearchWorker with the necessary parameters for performing the search.
         """
         super().__init__()
-        self.libraries = libraries
+        self.url_templates = url_templates
         self.index = index
         self.search_type = search_type
         self.search_value = search_value
-        self._is_running = True
+        # Set by stop(); checked between libraries and between chunks of a page
+        self.stop_event = threading.Event()
         self.console_output = console_output
+        self.response_cache = response_cache if response_cache is not None else OrderedDict()
+        self.cache_lock = cache_lock if cache_lock is not None else threading.Lock()
+        # Responses whose bodies are being read, shut down by stop()
+        self.open_responses = set()
+        self.responses_lock = threading.Lock()
+
+        # One pooled session for the whole search so libraries on the same host share
+        # connections; transient server errors are retried a couple of times. Read timeouts
+        # are not retried and a 429's Retry-After is ignored, so a slow or rate-limiting
+        # catalog holds a pool thread for one timeout and short backoffs at most.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32,
+            max_retries=Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              respect_retry_after_header=False)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Libraries are searched on pool threads, so console writes are queued to the GUI thread
+        if console_output:
+            self.log_message.connect(console_output.append)
 
     def run(self):
         """
         Run the search process for the specified libraries. Update the status based on search results.
         """
-        if not self._is_running:
+        if self.stop_event.is_set():
             return
 
-        libraries_to_process = [(self.index, self.libraries[self.index])] if self.index is not None else enumerate(self.libraries)
+        templates_to_process = [(self.index, self.url_templates[self.index])] if self.index is not None else list(enumerate(self.url_templates))
 
-        for i, library in libraries_to_process:
-            if not self._is_running:
-                break
-
-            url = self.construct_url(library)
+        # Libraries that share a catalog produce the same URL; each URL is fetched once
+        # and its result is reported for every row that uses it
+        url_rows = {}
+        for i, url_template in templates_to_process:
+            url = self.construct_url(url_template)
             if not url:
                 self.update_status.emit(i, "Error", "URL construction failed.")
                 continue
-
+            url_rows.setdefault(url, []).append(i)
             self.update_status.emit(i, "Searching...", url)
 
-            try:
-                if not self._is_running:
-                    break
+        # Each URL is an independent network request, so they are searched side by side
+        max_workers = min(32, len(url_rows)) or 1
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {executor.submit(self.search_url, url, rows) for url, rows in url_rows.items()}
+        # Waits are short so stop() is noticed promptly
+        while pending and not self.stop_event.is_set():
+            done, pending = wait_futures(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        # Searches that have not started are dropped; requests still running after stop()
+        # end on their own without holding up this thread or the GUI waiting on it
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        self.session.close()
+        self.search_complete.emit()
 
-                response = requests.get(url, allow_redirects=True, timeout=15)
-                response.raise_for_status()
+    def search_url(self, url, rows):
+        """
+        Search a single URL and emit its status for every library row that uses it.
+        """
+        if self.stop_event.is_set():
+            return
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+        error = None
+        try:
+            status, status_url = self.check_page(url)
+        except requests.exceptions.RequestException as e:
+            status, status_url, error = "Error", url, f"Request error: {str(e)}"
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # A page that cannot be read or parsed fails its own rows, not the whole search
+            status, status_url, error = "Error", url, f"Error checking page: {str(e)}"
+
+        # Nothing is reported after stop(); requests it cut short are cancellations, not catalog errors
+        if self.stop_event.is_set():
+            return
 
-                if self.check_not_found_conditions(soup):
-                    self.update_status.emit(i, "Not Found", url)
-                    continue
+        for i in rows:
+            if error:
+                self.log_error(i, error)
+            self.update_status.emit(i, status, status_url)
 
-                if self.check_found_conditions(soup, response) or self.check_general_results(response):
-                    self.update_status.emit(i, "Found", response.url)
-                else:
-                    self.update_status.emit(i, "Not Found", url)
+    def check_page(self, url):
+        """
+        Fetch the URL and return ("Found", final_url) or ("Not Found", url) for it.
+        """
+        body, final_url, redirected, encoding = self.fetch_page(url)
 
-            except requests.exceptions.RequestException as e:
-                self.log_error(i, f"Request error: {str(e)}")
-                self.update_status.emit(i, "Error", url)
+        # Most catalogs say "no results" in the page text, which settles it without parsing the page
+        visible_text = _NON_TEXT_RE.sub(b' ', body)
+        if _NOT_FOUND_RE.search(visible_text):
+            return "Not Found", url
 
-        self._is_running = False
-        self.search_complete.emit()
+        # A redirect to a detailed item page (common in Koha) is a hit without parsing the page
+        if redirected:
+            return "Found", final_url
 
-    def construct_url(self, library):
-        """
-        Construct the URL based on the search type.
+        try:
+            tree = lxml_html.document_fromstring(body, parser=_page_parser(encoding))
+        except etree.ParserError:
+            # An empty page has nothing that could count as a result
+            return "Not Found", url
+
+        if _check_not_found_conditions(tree):
+            return "Not Found", url
+
+        if _check_found_conditions(tree, body, visible_text):
+            return "Found", final_url
+        return "Not Found", url
+
+    def fetch_page(self, url):
+        """
+        Return (body, final_url, redirected, encoding) for the URL, using the response cache
+        when possible. body is the raw page bytes, undecoded.
+        A single-library retry, or a page cached more than _RESPONSE_CACHE_TTL seconds ago,
+        is fetched again.
+        """
+        if self.index is None:
+            with self.cache_lock:
+                entry = self.response_cache.get(url)
+                if entry is not None and time.monotonic() - entry[0] < _RESPONSE_CACHE_TTL:
+                    self.response_cache.move_to_end(url)
+                    return entry[1]
+
+        response = self.session.get(url, allow_redirects=True, timeout=(3, 10), stream=True)
+        with self.responses_lock:
+            self.open_responses.add(response)
+        try:
+            with response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    body += chunk
+                    if len(body) >= _MAX_PAGE_BYTES or self.stop_event.is_set():
+                        break
+                page = (bytes(body[:_MAX_PAGE_BYTES]), response.url, bool(response.history),
+                        _header_encoding(response))
+        finally:
+            with self.responses_lock:
+                self.open_responses.discard(response)
+
+        # A page cut short by stop() is not cached
+        if self.stop_event.is_set():
+            return page
+
+        with self.cache_lock:
+            self.response_cache[url] = (time.monotonic(), page)
+            self.response_cache.move_to_end(url)
+            if len(self.response_cache) > _RESPONSE_CACHE_SIZE:
+                self.response_cache.popitem(last=False)
+        return page
+
+    def construct_url(self, url_template):
+        """
+        Construct the URL from the library's URL template based on the search type.
         """
         url = None
         if self.search_type == "isbn":
-            url_template = library.get("isbn_url", "")
             isbn = self.search_value.strip()
             if not isbn:
                 self.log_error(self.index, "ISBN field is empty. Cannot perform the search.")
                 return None
-            url = url_template.format(isbn=urllib.parse.quote(isbn))
+            url = _format_isbn_url(url_template, isbn)
         elif self.search_type == "title_author":
-            url_template = library.get("title_author_url", "")
             title, author = self.search_value
             title, author = title.strip(), author.strip()
             if not title or not author:
                 self.log_error(self.index, "Title or Author field is empty. Cannot perform the search.")
                 return None
-            url = url_template.format(title=urllib.parse.quote(title), author=urllib.parse.quote(author))
+            url = _format_title_author_url(url_template, title, author)
         return url
 
-    def check_not_found_conditions(self, soup):
-        """
-        Check for various "not found" conditions in the HTML content.
-        """
-        text_without_scripts = ' '.join(soup.stripped_strings).lower()  # Join all text excluding script tags
-
-        not_found_conditions = [
-            any(phrase in text_without_scripts for phrase in [
-                "no results found", "no matches found", "no entries found", "search resulted in no hits",
-                "no results!", "your search found no results.", "no records found"
-            ]),
-            soup.find("h1", text=re.compile("no results", re.IGNORECASE)),
-            soup.find("h1", text=re.compile("no results available", re.IGNORECASE)),
-            soup.find("div", {"id": "documents", "class": "noresults"}),
-            soup.find("tr", class_="yourEntryWouldBeHere")
-        ]
-        return any(not_found_conditions)
-
-    def check_found_conditions(self, soup, response):
-        """
-        Check for various "found" conditions in the HTML content.
-        Prioritize exact text searches over generic elements.
-        """
-        # Check if the response was redirected to a detailed item page (common in Koha)
-        if response.history and len(response.history) > 0:
-            return True
-
-        found_conditions = [
-            soup.find_all("tr", class_="browseEntry"),  # Generic result rows
-            soup.find("span", class_="results-bar-item results-bar-item-record-count"),  # Result count bar
-            self.check_meta_total_results(soup),  # Meta tag check for total results
-            soup.find_all("div", class_=re.compile(r'document')),  # General document classes
-            soup.find("div", class_="bibDisplayContentMain"),  # Bibliographic display section
-            soup.find("div", class_="bibDisplayItemsMain"),  # Bibliographic item section
-            soup.find("div", class_="bibliographicData"),  # Detailed bibliographic data (specific to full record)
-            soup.find(text=re.compile(r'Results:\s*\d+', re.IGNORECASE)),  # "Results: X found"
-            soup.find(id="numresults"),  # Number of results indicator
-            soup.find("span", class_="results-bar-item results-bar-item-record-count"),  # Duplicate of earlier check, could be removed
-            soup.find("div", class_="browseSearchtoolMessage"),  # Search tool messages, possibly a success message
-            self.check_search_stats(soup),  # Custom check for search statistics
-            soup.find("span", text=re.compile(r"\d+\s+(?:results?|result|of\s+results?)\s*found", re.IGNORECASE))  # Result count regex
-        ]
-        return any(found_conditions)
-
-    def check_meta_total_results(self, soup):
-        """
-        Check the meta tag for total results.
-        """
-        total_results_meta = soup.find("meta", {"name": "totalResults"})
-        if total_results_meta:
-            try:
-                return int(total_results_meta.get("content", "0")) > 0
-            except ValueError:
-                return False
-        return False
-
-    def check_general_results(self, response):
-        """
-        Check for general results using various regex patterns.
-        """
-        response_text_lower = response.text.lower()
-        # Existing regex patterns to check for general results
-        patterns = [
-            r'\b(?:your\s+search\s+returned\s+|(\d+)\s+)(?:results?|result)\b',  # Example: "Your search returned 100 results"
-            r'\bResults:\s*\d+',  # Example: "Results: 100"
-            r'\b(\d+)\s+(?:results?|result)\s+found\b',  # Example: "100 results found"
-            r'\b(\d+)-(\d+)\s+of\s+(\d+)\b'  # Example: "1-25 of 10000"
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, response_text_lower):
-                return True  # If any pattern matches, consider it as results found.
-        return False  # Return False if no patterns match
-
-    def check_search_stats(self, soup):
-        """
-        Check the search stats div for data-record-total attribute.
-        """
-        search_stats_div = soup.find("div", class_="search-stats")
-        if search_stats_div and search_stats_div.get('data-record-total'):
-            try:
-                return int(search_stats_div['data-record-total']) > 0
-            except ValueError:
-                return False
-        return False
-
     def stop(self):
         """
-        Stop the search process by terminating the thread.
-        """
-        self._is_running = False
-        self.wait()
+        Stop the search process without waiting for it. The worker thread finishes within
+        a fraction of a second, and the sockets of responses still being read are shut down
+        so their reads end now. Requests still connecting or waiting for headers end on their
+        own pool threads without holding anything up.
+        """
+        self.stop_event.set()
+        with self.responses_lock:
+            responses = list(self.open_responses)
+        for response in responses:
+            # close() would block on the read in progress; shutdown() (urllib3 2.3+) wakes it
+            shutdown = getattr(response.raw, "shutdown", None)
+            if shutdown:
+                shutdown()
+        self.session.close()
 
     def log_error(self, index, message):
         """
         Log an error message to the console and update the status for the given library.
         """
-        if self.console_output:
-            self.console_output.append(f"Library {index}: {message}")
+        self.log_message.emit(f"Library {index}: {message}")
         self.update_status.emit(index, "Error", message)
+
+
+class LibrarySaveWorker(QThread):
+    """
+    A QThread that writes the serialized library list to libraries.json.
+    Emits failed with a message if the file cannot be written.
+    """
+    failed = pyqtSignal(str)
+
+    def __init__(self, libraries_json):
+        """
+        Initialize the LibrarySaveWorker with the JSON text to write.
+        """
+        super().__init__()
+        self.libraries_json = libraries_json
+
+    def run(self):
+        """
+        Write the library list to disk.
+        """
+        try:
+            with open("libraries.json", "w", encoding="utf-8") as file:
+                file.write(self.libraries_json)
+        except OSError as e:
+            self.failed.emit(f"Failed to save the library list: {e}")
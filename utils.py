@@ -2,10 +2,65 @@
 This module contains utilities for creating and downloading MARC records.
 """
 
-import re
+import os
+import string
+from dataclasses import dataclass
+from operator import attrgetter
 from pymarc import Record, Field, Subfield
 from PyQt5.QtWidgets import QFileDialog, QMessageBox, QTextEdit
 
+_FILENAME_KEEP = frozenset(map(ord, string.ascii_letters + string.digits))
+
+
+class _FilenameTable(dict):
+    """
+    str.translate table for clean_filename: keeps ASCII letters, digits and whitespace
+    and drops every other character. Entries are filled in as characters are first seen,
+    instead of building a table for all of Unicode up front.
+    """
+    def __missing__(self, codepoint):
+        keep = codepoint in _FILENAME_KEEP or chr(codepoint).isspace()
+        self[codepoint] = result = codepoint if keep else None
+        return result
+
+
+_FILENAME_TABLE = _FilenameTable()
+
+# Folder the last MARC record was saved to this session, where the next save dialog opens
+_last_save_dir = ''
+
+
+@dataclass(frozen=True, slots=True)
+class MarcInput:
+    """
+    Bibliographic details entered on the cataloging tab, used to build a MARC record.
+    Text fields default to an empty string when not provided.
+    """
+    title: str = ''
+    subtitle: str = ''
+    author: str = ''
+    second_author: str = ''
+    third_author: str = ''
+    editor: str = ''
+    second_editor: str = ''
+    copyright_year: str = ''
+    edition: str = ''
+    publisher: str = ''
+    publisher_location: str = ''
+    lccn: str = ''
+    isbn: str = ''
+    second_isbn: str = ''
+    loc_call_number: str = ''
+    pages: str = ''
+    book_height: str = ''
+    references: bool = False
+    references_page_range: str = ''
+    index: bool = False
+    summary: str = ''
+    loc_subject_1: str = ''
+    loc_subject_2: str = ''
+    loc_subject_3: str = ''
+
 
 class LineHighlightingTextEdit(QTextEdit):
     """
@@ -19,225 +74,192 @@ class LineHighlightingTextEdit(QTextEdit):
         """
         Highlights the line under the cursor when the mouse is pressed.
         """
-        cursor = self.cursorForPosition(event.pos())
+        # Qt places the text cursor at the click first; the line is then selected from there
+        super().mousePressEvent(event)
+        cursor = self.textCursor()
         cursor.select(cursor.LineUnderCursor)
         self.setTextCursor(cursor)
-        super().mousePressEvent(event)
 
 
-def create_marc_record(console_output, data):
+class _BufferedConsole:
     """
-    Creates a MARC record based on the provided bibliographic information.
-
-    :param console_output: QTextEdit for logging output.
-    :param data: A dictionary containing bibliographic details.
-    :return: MARC record in binary format.
+    Collects console lines and appends them to the console widget in one call when the
+    with block ends, so the widget lays out and repaints once instead of once per line.
     """
+    def __init__(self, console_output):
+        self.console_output = console_output
+        self.lines = []
 
-    if console_output:
-        console_output.append("Creating MARC record...")
+    def __enter__(self):
+        return self
 
-    record = Record()
+    def __exit__(self, *exc_info):
+        self.flush()
 
-    # Title (245) and subtitle, ensure 'c' subfield is not included here for author
-    if data.get('title'):
-        record.add_field(Field(tag='245', indicators=['1', '0'], subfields=[
-            Subfield('a', data['title']),
-            Subfield('b', data['subtitle'])
-        ]))
-
-    # Primary Author (100)
-    if data.get('author'):
-        record.add_field(Field(tag='100', indicators=['1', ' '], subfields=[
-            Subfield('a', data['author'])
-        ]))
-
-    # Second and third authors (700)
-    add_author_fields(record, data.get('second_author'), data.get('third_author'))
-
-    # Editors (700)
-    add_editor_fields(record, data.get('editor'), data.get('second_editor'))
-
-    # LCCN (010)
-    add_lccn_field(record, data.get('lccn'))
-
-    # ISBNs (020)
-    add_isbn_fields(record, data.get('isbn'), data.get('second_isbn'))
-
-    # LOC Call Number (050)
-    add_loc_call_number_field(record, data.get('loc_call_number'))
-
-    # Publisher and location (264 for publication with indicator 1)
-    add_publisher_and_copyright_fields(
-        record,
-        data.get('publisher_location'),
-        data.get('publisher'),
-        data.get('copyright_year')
-    )
-
-    # Edition (250)
-    if data.get('edition'):
-        record.add_field(Field(tag='250', indicators=[' ', ' '], subfields=[
-            Subfield('a', data['edition'])
-        ]))
-
-    # Physical description (300)
-    add_physical_description_field(record, data.get('pages'), data.get('book_height'))
-
-    # Bibliographic references (504)
-    add_references_field(record, data.get('references'), data.get('references_page_range'))
-
-    # Index (500)
-    if data.get('index'):
-        record.add_field(Field(tag='500', indicators=[' ', ' '], subfields=[
-            Subfield('a', "Includes index.")
-        ]))
+    def append(self, text):
+        """
+        Queue a line for the console.
+        """
+        self.lines.append(text)
 
-    # Summary (520)
-    if data.get('summary'):
-        record.add_field(Field(tag='520', indicators=[' ', ' '], subfields=[
-            Subfield('a', data['summary'])
-        ]))
+    def flush(self):
+        """
+        Append the queued lines to the console widget.
+        """
+        if self.lines:
+            self.console_output.append("\n".join(self.lines))
+            self.lines.clear()
 
-    # LOC Subject Headings (650)
-    add_loc_subject_headings(
-        record,
-        data.get('loc_subject_1'),
-        data.get('loc_subject_2'),
-        data.get('loc_subject_3')
-    )
 
-    return record.as_marc()
+# Indicator pairs shared by every field that uses them; pymarc copies them into each Field
+_IND_BLANK = (' ', ' ')
+_IND_1_BLANK = ('1', ' ')
+_IND_1_0 = ('1', '0')
+_IND_0_4 = ('0', '4')
+_IND_BLANK_0 = (' ', '0')
+_IND_BLANK_1 = (' ', '1')
+_IND_BLANK_4 = (' ', '4')
 
-def add_author_fields(record, second_author, third_author):
-    """
-    Adds secondary and tertiary authors to the MARC record.
-    """
-    if second_author:
-        record.add_field(Field(tag='700', indicators=['1', ' '], subfields=[
-            Subfield('a', second_author)
-        ]))
-    if third_author:
-        record.add_field(Field(tag='700', indicators=['1', ' '], subfields=[
-            Subfield('a', third_author)
-        ]))
+# MarcInput values read by each helper for fields whose text is built from the input
+_PUBLICATION_VALUES = attrgetter('publisher_location', 'publisher', 'copyright_year')
+_PHYSICAL_DESCRIPTION_VALUES = attrgetter('pages', 'book_height')
+_REFERENCES_VALUES = attrgetter('references', 'references_page_range')
 
 
-def add_editor_fields(record, editor, second_editor):
-    """
-    Adds editors to the MARC record.
+def create_marc_record(console_output, data):
     """
-    if editor:
-        record.add_field(Field(tag='700', indicators=['1', ' '], subfields=[
-            Subfield('a', editor)
-        ]))
-    if second_editor:
-        record.add_field(Field(tag='700', indicators=['1', ' '], subfields=[
-            Subfield('a', second_editor)
-        ]))
-
+    Creates a MARC record based on the provided bibliographic information.
 
-def add_lccn_field(record, lccn):
-    """
-    Adds LCCN to the MARC record.
+    :param console_output: QTextEdit for logging output.
+    :param data: A MarcInput containing bibliographic details.
+    :return: MARC record in binary format.
     """
-    if lccn:
-        record.add_field(Field(tag='010', indicators=[' ', ' '], subfields=[
-            Subfield('a', lccn)
-        ]))
 
+    if console_output:
+        console_output.append("Creating MARC record...")
 
-def add_isbn_fields(record, isbn, second_isbn):
-    """
-    Adds ISBNs to the MARC record.
-    """
-    if isbn:
-        record.add_field(Field(tag='020', indicators=[' ', ' '], subfields=[
-            Subfield('a', isbn)
-        ]))
-    if second_isbn:
-        record.add_field(Field(tag='020', indicators=[' ', ' '], subfields=[
-            Subfield('a', second_isbn)
-        ]))
-
+    # Fields are collected first and added to the record in one call
+    fields = []
+    for spec in _FIELD_SPECS:
+        if callable(spec):
+            # Fields whose text is built from the input rather than copied from it
+            spec(fields, data)
+            continue
+        tag, indicators, subfield_specs = spec
+        values = [(code, getattr(data, attribute)) for code, attribute in subfield_specs]
+        if values[0][1]:
+            fields.append(Field(tag=tag, indicators=indicators, subfields=[
+                Subfield(code, value) for code, value in values if value
+            ]))
 
-def add_loc_call_number_field(record, loc_call_number):
-    """
-    Adds LOC Call Number to the MARC record.
-    """
-    if loc_call_number:
-        record.add_field(Field(tag='050', indicators=['0', '4'], subfields=[
-            Subfield('a', loc_call_number)
-        ]))
+    record = Record()
+    record.add_field(*fields)
+    return record.as_marc()
 
 
-def add_publisher_and_copyright_fields(record, publisher_location, publisher, copyright_year):
+def add_publisher_and_copyright_fields(fields, data):
     """
-    Adds publisher and copyright information to the MARC record.
+    Adds publisher and copyright information to the list of MARC fields.
+    Only the subfields that have a value are included.
     """
-    if publisher or publisher_location or copyright_year:
-        record.add_field(Field(tag='264', indicators=[' ', '1'], subfields=[
-            Subfield('a', publisher_location),
-            Subfield('b', publisher),
-            Subfield('c', f"{copyright_year}")
-        ]))
+    publisher_location, publisher, copyright_year = values = _PUBLICATION_VALUES(data)
+    if not any(values):
+        return
+    subfields = []
+    if publisher_location:
+        subfields.append(Subfield('a', publisher_location))
+    if publisher:
+        subfields.append(Subfield('b', publisher))
+    if copyright_year:
+        subfields.append(Subfield('c', copyright_year))
+    fields.append(Field(tag='264', indicators=_IND_BLANK_1, subfields=subfields))
     if copyright_year:
-        record.add_field(Field(tag='264', indicators=[' ', '4'], subfields=[
+        fields.append(Field(tag='264', indicators=_IND_BLANK_4, subfields=[
             Subfield('c', f"c{copyright_year}.")
         ]))
 
 
-def add_physical_description_field(record, pages, book_height):
+def add_physical_description_field(fields, data):
     """
-    Adds physical description (pages and book height) to the MARC record.
+    Adds physical description (pages and book height) to the list of MARC fields.
+    Only the subfields that have a value are included, so no " p." or " cm." is left empty.
     """
-    if pages or book_height:
-        record.add_field(Field(tag='300', indicators=[' ', ' '], subfields=[
-            Subfield('a', f"{pages} p."),
-            Subfield('c', f"{book_height} cm.")
-        ]))
-
-
-def add_references_field(record, references, references_page_range):
+    pages, book_height = _PHYSICAL_DESCRIPTION_VALUES(data)
+    if not (pages or book_height):
+        return
+    subfields = []
+    if pages:
+        subfields.append(Subfield('a', f"{pages} p."))
+    if book_height:
+        subfields.append(Subfield('c', f"{book_height} cm."))
+    fields.append(Field(tag='300', indicators=_IND_BLANK, subfields=subfields))
+
+
+def add_references_field(fields, data):
     """
-    Adds bibliographic references to the MARC record.
+    Adds bibliographic references to the list of MARC fields.
     """
-    if references:
-        references_text = "Includes bibliographical references"
-        if references_page_range:
-            references_text += f" (p. {references_page_range})."
-        record.add_field(Field(tag='504', indicators=[' ', ' '], subfields=[
-            Subfield('a', references_text)
-        ]))
-
-
-def add_loc_subject_headings(record, loc_subject_1, loc_subject_2, loc_subject_3):
+    references, references_page_range = _REFERENCES_VALUES(data)
+    if not references:
+        return
+    references_text = "Includes bibliographical references"
+    if references_page_range:
+        references_text += f" (p. {references_page_range})."
+    fields.append(Field(tag='504', indicators=_IND_BLANK, subfields=[
+        Subfield('a', references_text)
+    ]))
+
+
+def add_index_field(fields, data):
     """
-    Adds LOC Subject Headings to the MARC record.
+    Adds the index note to the list of MARC fields.
     """
-    if loc_subject_1:
-        record.add_field(Field(tag='650', indicators=[' ', '0'], subfields=[
-            Subfield('a', loc_subject_1)
-        ]))
-    if loc_subject_2:
-        record.add_field(Field(tag='650', indicators=[' ', '0'], subfields=[
-            Subfield('a', loc_subject_2)
-        ]))
-    if loc_subject_3:
-        record.add_field(Field(tag='650', indicators=[' ', '0'], subfields=[
-            Subfield('a', loc_subject_3)
+    if data.index:
+        fields.append(Field(tag='500', indicators=_IND_BLANK, subfields=[
+            Subfield('a', "Includes index.")
         ]))
 
+
+# The record's fields in the order they are added. A (tag, indicators, ((subfield code,
+# MarcInput attribute), ...)) entry copies values straight from the input: the field is
+# added when its first subfield has a value, with only the subfields that have one.
+# A function entry builds its fields from the input itself.
+_FIELD_SPECS = (
+    ('245', _IND_1_0, (('a', 'title'), ('b', 'subtitle'))),  # Title and subtitle, no author 'c'
+    ('100', _IND_1_BLANK, (('a', 'author'),)),  # Primary author
+    ('700', _IND_1_BLANK, (('a', 'second_author'),)),  # Second and third authors
+    ('700', _IND_1_BLANK, (('a', 'third_author'),)),
+    ('700', _IND_1_BLANK, (('a', 'editor'),)),  # Editors
+    ('700', _IND_1_BLANK, (('a', 'second_editor'),)),
+    ('010', _IND_BLANK, (('a', 'lccn'),)),  # LCCN
+    ('020', _IND_BLANK, (('a', 'isbn'),)),  # ISBNs
+    ('020', _IND_BLANK, (('a', 'second_isbn'),)),
+    ('050', _IND_0_4, (('a', 'loc_call_number'),)),  # LOC call number
+    add_publisher_and_copyright_fields,  # Publisher and location (264)
+    ('250', _IND_BLANK, (('a', 'edition'),)),  # Edition
+    add_physical_description_field,  # Physical description (300)
+    add_references_field,  # Bibliographic references (504)
+    add_index_field,  # Index (500)
+    ('520', _IND_BLANK, (('a', 'summary'),)),  # Summary
+    ('650', _IND_BLANK_0, (('a', 'loc_subject_1'),)),  # LOC subject headings
+    ('650', _IND_BLANK_0, (('a', 'loc_subject_2'),)),
+    ('650', _IND_BLANK_0, (('a', 'loc_subject_3'),)),
+)
+
+
 def clean_filename(filename):
     """Remove any characters that are not alphanumeric, spaces, or underscores."""
-    return re.sub(r'[^a-zA-Z0-9\s]', '', filename).strip().replace(' ', '_')
+    return filename.translate(_FILENAME_TABLE).strip().replace(' ', '_')
 
 
 def download_marc_record(marc_record, title, author, console_output):
     """
     Downloads the MARC record to a file.
     """
+    global _last_save_dir  # pylint: disable=global-statement
     default_filename = f"{clean_filename(author)}_{clean_filename(title)}.mrc"
+    if _last_save_dir:
+        default_filename = os.path.join(_last_save_dir, default_filename)
 
     options = QFileDialog.Options()
     save_path, _ = QFileDialog.getSaveFileName(
@@ -248,8 +270,10 @@ def download_marc_record(marc_record, title, author, console_output):
         try:
             with open(save_path, 'wb') as file:
                 file.write(marc_record)
-            console_output.append("MARC Record saved successfully.")
-            console_output.append(f"Filename: {save_path}")
+            _last_save_dir = os.path.dirname(save_path)
+            with _BufferedConsole(console_output) as console:
+                console.append("MARC Record saved successfully.")
+                console.append(f"Filename: {save_path}")
         except IOError as e:
             console_output.append(f"File I/O error: {str(e)}")
             QMessageBox.critical(